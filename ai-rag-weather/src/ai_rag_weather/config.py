@@ -2,6 +2,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 import os
 
 """Configuration management for the RAGChain-WeatherBot application.
@@ -17,29 +18,26 @@ ENV_PATH = ROOT / ".env"
 def _load_env_exact(path: Path) -> None:
     """Load environment variables from a specific .env file path.
 
-    Attempts to load the .env file using python-dotenv. If the OPENAI_API_KEY
-    is not found in the environment after loading, it parses the file and
-    manually injects the key into os.environ as a fallback.
+    Parses the .env file once and injects every defined value into os.environ
+    without overriding variables that are already set.
 
     Args:
         path: The path to the .env file.
     """
     try:
-        from dotenv import load_dotenv, dotenv_values
-    except Exception:
+        from dotenv import dotenv_values
+    except ImportError:
         print("[config] python-dotenv not installed; `pip install python-dotenv` recommended")
         return
 
-    loaded = load_dotenv(dotenv_path=path, override=False, verbose=True)
-    print(f"[config] load_dotenv({path}) -> {loaded} (exists={path.exists()})")
+    vals = dotenv_values(dotenv_path=path)
+    for key, value in vals.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    print(f"[config] loaded {len(vals)} value(s) from {path} (exists={path.exists()})")
 
     if not os.getenv("OPENAI_API_KEY"):
-        vals = dotenv_values(dotenv_path=path)
-        if "OPENAI_API_KEY" in vals and vals["OPENAI_API_KEY"]:
-            os.environ.setdefault("OPENAI_API_KEY", vals["OPENAI_API_KEY"])
-            print("[config] Injected OPENAI_API_KEY into os.environ from parsed .env")
-        else:
-            print("[config] OPENAI_API_KEY not found in parsed .env or empty")
+        print("[config] OPENAI_API_KEY not found in parsed .env or empty")
 
 _load_env_exact(ENV_PATH)
 
@@ -48,11 +46,14 @@ class Settings(BaseSettings):
 
     Defines environment variables for LLM providers, embeddings, LangSmith tracing,
     Qdrant vector database, OpenWeatherMap API, and application settings.
+    Values are read from os.environ, which _load_env_exact has already populated
+    from the .env file.
     """
     LLM_PROVIDER: str = Field("openai")
     OPENAI_API_KEY: str = Field("")
     EMBEDDINGS_PROVIDER: str = Field("openai")
     SENTENCE_MODEL: str = Field("sentence-transformers/all-MiniLM-L6-v2")
+    EMBED_CACHE_DIR: Optional[str] = Field(None)
     LANGCHAIN_TRACING_V2: bool = Field(True)
     LANGCHAIN_ENDPOINT: str = Field("https://api.smith.langchain.com")
     LANGCHAIN_API_KEY: str = Field("")
@@ -60,15 +61,12 @@ class Settings(BaseSettings):
     QDRANT_HOST: str = Field("qdrant")
     QDRANT_PORT: int = Field(6333)
     QDRANT_COLLECTION: str = Field("ai_rag_weather_docs")
+    QDRANT_HNSW_EF: Optional[int] = Field(None)
     OPENWEATHER_API_KEY: str = Field("")
     OPENWEATHER_UNITS: str = Field("metric")
     APP_ENV: str = Field("dev")
 
-    model_config = SettingsConfigDict(
-        env_file=ENV_PATH,
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
 @lru_cache(maxsize=1)
 def get_settings() -> "Settings":
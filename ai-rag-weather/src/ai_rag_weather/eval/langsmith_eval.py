@@ -1,30 +1,44 @@
+import asyncio
 import os
+from functools import lru_cache, wraps
 from langchain.callbacks.tracers.langchain import LangChainTracerV2
 from ai_rag_weather.config import get_settings
+from ai_rag_weather.graph.nodes import STATE_TEMPLATE
 
 settings = get_settings()
 
-os.environ["LANGCHAIN_TRACING_V2"] = str(settings.LANGCHAIN_TRACING_V2).lower()
-os.environ["LANGCHAIN_ENDPOINT"] = settings.LANGCHAIN_ENDPOINT
-os.environ["LANGCHAIN_API_KEY"] = settings.LANGCHAIN_API_KEY
-os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
+if settings.LANGCHAIN_TRACING_V2:
+    os.environ["LANGCHAIN_TRACING_V2"] = "true"
+    for _name, _value in (
+        ("LANGCHAIN_ENDPOINT", settings.LANGCHAIN_ENDPOINT),
+        ("LANGCHAIN_API_KEY", settings.LANGCHAIN_API_KEY),
+        ("LANGSMITH_PROJECT", settings.LANGSMITH_PROJECT),
+    ):
+        if _value:
+            os.environ[_name] = _value
 
-tracer = LangChainTracerV2()
+@lru_cache(maxsize=1)
+def _tracer():
+    return LangChainTracerV2()
 
 def with_tracing(func):
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        with tracer:
+        if not settings.LANGCHAIN_TRACING_V2:
+            return func(*args, **kwargs)
+        with _tracer():
             return func(*args, **kwargs)
     return wrapper
 
-def eval_harness(graph, queries=None):
+def eval_harness(graph, queries=None, max_concurrency=None):
     queries = queries or [
         "What's the weather in London?",
         "Summarize the introduction from the PDF.",
     ]
-    results = []
-    for q in queries:
-        state = {"user_input": q, "intent": None, "weather": None, "answer": None, "retrieval": None}
-        answer = graph.invoke(state)
-        results.append({"query": q, "answer": answer})
-    return results
+    states = [{**STATE_TEMPLATE, "user_input": q} for q in queries]
+
+    async def _run():
+        return await graph.abatch(states, config={"max_concurrency": max_concurrency})
+
+    answers = asyncio.run(_run())
+    return [{"query": q, "answer": answer} for q, answer in zip(queries, answers)]
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from langgraph.graph import StateGraph, END
 from .nodes import (
     router_node, weather_node, rag_node, synthesis_node,
@@ -11,9 +12,14 @@ routing them to either weather or document-based question-answering nodes,
 and synthesizing the final response.
 """
 
+_ROUTES = {"weather": "weather", "doc_qa": "rag"}
+
+@lru_cache(maxsize=1)
 def build_graph():
     """Construct and compile the LangChain state graph.
 
+    The compiled graph is cached, so repeated calls return the same instance.
+
     Returns:
         A compiled LangChain StateGraph that routes queries to weather or RAG nodes
         and synthesizes the final response.
@@ -30,7 +36,7 @@ def build_graph():
     g.add_conditional_edges(
         "router",
         route_intent,
-        {"weather": "weather", "doc_qa": "rag"},
+        _ROUTES,
     )
 
     g.add_edge("weather", "synthesis")
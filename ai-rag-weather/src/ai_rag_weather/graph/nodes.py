@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import re
-from typing import TypedDict, Optional, Any, Dict
-from difflib import SequenceMatcher
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TypedDict, Optional, Any, Dict, List, Mapping
+from rapidfuzz import process, fuzz
 
-from ai_rag_weather.llm.providers import LLMProvider, EmbeddingsProvider
-from ai_rag_weather.vectordb.qdrant_store import QdrantStore
+from ai_rag_weather.llm.providers import get_embeddings, get_llm
+from ai_rag_weather.vectordb.qdrant_store import get_qdrant
 from ai_rag_weather.rag.retriever import RAGRetriever
+from ai_rag_weather.rag.similarity_cache import get_similarity_cache
 from ai_rag_weather.weather.client import WeatherClient
+from ai_rag_weather.weather.cities import KNOWN_CITIES
 
 """Graph nodes for AI RAG WeatherBot query processing.
 
@@ -32,11 +36,34 @@ class GraphState(TypedDict, total=False):
     retrieval: Optional[Dict[str, Any]]
     answer: Optional[str]
 
+# Initial values for every GraphState field except user_input; splat into new states,
+# e.g. {**STATE_TEMPLATE, "user_input": query}. Read-only, so callers cannot alter it.
+STATE_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+    {"intent": None, "weather": None, "answer": None, "retrieval": None}
+)
+
 _WEATHER_HINTS = (
     "weather", "temperature", "temp", "forecast", "rain",
     "humidity", "wind", "snow", "sun", "cloud", "visibility"
 )
 
+# One pass over the lowercased query; the lookarounds make a hint match only as a whole
+# run of letters, e.g. "temp" in "temp?" or "temp2" but not in "template".
+_RX_INTENT = re.compile(
+    r"(?<![a-z])(?P<weather>" + "|".join(_WEATHER_HINTS) + r")(?![a-z])"
+)
+_RX_IN_AT = re.compile(r"\b(?:in|at)\s+([A-Z][a-zA-Z\-\.’']+(?:\s+[A-Z][a-zA-Z\-\.’']+)*)")
+_RX_WEATHER_IN = re.compile(r"weather\s+in\s+([A-Z][a-zA-Z\-\.’']+(?:\s+[A-Z][a-zA-Z\-\.’']+)*)", re.I)
+_CITY_MAX_WORDS = max(name.count(" ") + 1 for name in KNOWN_CITIES)
+_RX_CAPITALIZED = re.compile(r"[A-Z][a-zA-Z\-\.’']+(?:\s+[A-Z][a-zA-Z\-\.’']+)*")
+# Capitalized words that are never worth geocoding on their own.
+_NON_CITY_WORDS = frozenset(_WEATHER_HINTS) | frozenset({
+    "what", "whats", "what's", "how", "is", "will", "does", "do", "can", "tell", "show", "give",
+    "me", "i", "the", "today", "tomorrow", "tonight", "now", "please", "current", "nice",
+    "forecasts", "weather's", "sunny", "rainy", "cloudy", "windy",
+})
+_MAX_GEOCODE_CANDIDATES = 2
+
 def _fuzzy_contains(text: str, keywords: tuple, threshold: float = 0.85) -> bool:
     """Check if any word in the text fuzzy-matches a keyword.
 
@@ -48,15 +75,18 @@ def _fuzzy_contains(text: str, keywords: tuple, threshold: float = 0.85) -> bool
     Returns:
         True if a word in the text matches a keyword with similarity >= threshold, False otherwise.
     """
+    cutoff = threshold * 100
     for word in text.lower().split():
-        for kw in keywords:
-            if SequenceMatcher(None, word, kw).ratio() >= threshold:
-                return True
+        if process.extractOne(word, keywords, scorer=fuzz.ratio, score_cutoff=cutoff):
+            return True
     return False
 
+@lru_cache(maxsize=1024)
 def _classify_intent(text: str) -> str:
     """Classify the intent of a user query.
 
+    Results are memoized per exact input string.
+
     Args:
         text: The user query string.
 
@@ -64,12 +94,32 @@ def _classify_intent(text: str) -> str:
         "weather" if the query is weather-related, "doc_qa" otherwise.
     """
     t = text.lower()
+    m = _RX_INTENT.search(t)
+    if m:
+        return m.lastgroup
     if _fuzzy_contains(t, _WEATHER_HINTS):
         return "weather"
-    if re.search(r"\b(what('?s)?|how)( is|s|’s)? the (weather|temperature)\b", t):
-        return "weather"
     return "doc_qa"
 
+def _lookup_known_city(text: str) -> Optional[str]:
+    """Find the first capitalized word or phrase in the text that names a known city.
+
+    Args:
+        text: The user query string.
+
+    Returns:
+        The matching phrase as written in the text, or None if no known city is mentioned.
+    """
+    tokens = [tok.strip(" .?!,;:\"()").removesuffix("'s").removesuffix("’s") for tok in text.split()]
+    for i, tok in enumerate(tokens):
+        if not tok[:1].isupper():
+            continue
+        for n in range(min(_CITY_MAX_WORDS, len(tokens) - i), 0, -1):
+            name = " ".join(tokens[i:i + n])
+            if name.lower() in KNOWN_CITIES:
+                return name
+    return None
+
 def _extract_city(text: str) -> Optional[str]:
     """Extract a city name from the user query.
 
@@ -79,15 +129,53 @@ def _extract_city(text: str) -> Optional[str]:
     Returns:
         The extracted city name, or None if no city is found.
     """
-    m = re.search(r"\b(?:in|at)\s+([A-Z][a-zA-Z\-\.’']+(?:\s+[A-Z][a-zA-Z\-\.’']+)*)", text)
+    m = _RX_IN_AT.search(text)
     if m:
         city = m.group(1).strip(" .?!,;:").strip()
         return city
-    m = re.search(r"weather\s+in\s+([A-Z][a-zA-Z\-\.’']+(?:\s+[A-Z][a-zA-Z\-\.’']+)*)", text, flags=re.I)
-    if m:
-        return m.group(1).strip(" .?!,;:")
-    tokens = re.findall(r"[A-Z][a-zA-Z\-\.’']+(?:\s+[A-Z][a-zA-Z\-\.’']+)*", text)
-    return tokens[-1] if tokens else None
+    if "weather" in text.lower():
+        m = _RX_WEATHER_IN.search(text)
+        if m:
+            return m.group(1).strip(" .?!,;:")
+    return _lookup_known_city(text)
+
+def _city_candidates(text: str) -> List[str]:
+    """List capitalized phrases that could name a city not in KNOWN_CITIES.
+
+    Leading and trailing words such as "Forecast" or "What" are trimmed from each phrase.
+
+    Args:
+        text: The user query string.
+
+    Returns:
+        Candidate phrases, last one in the text first.
+    """
+    candidates = []
+    for phrase in _RX_CAPITALIZED.findall(text):
+        words = [w.strip(" .?!,;:") for w in phrase.split()]
+        while words and words[0].lower() in _NON_CITY_WORDS:
+            words.pop(0)
+        while words and words[-1].lower() in _NON_CITY_WORDS:
+            words.pop()
+        if words:
+            candidates.append(" ".join(words))
+    return candidates[::-1]
+
+def _geocode_city(client: WeatherClient, text: str) -> Optional[str]:
+    """Resolve a city the pattern and known-city lookups missed, using the geocoding API.
+
+    Args:
+        client: Weather client used for the geocoding requests.
+        text: The user query string.
+
+    Returns:
+        The name of the first candidate phrase the geocoder recognises, or None.
+    """
+    for candidate in _city_candidates(text)[:_MAX_GEOCODE_CANDIDATES]:
+        matches = client.search_cities(candidate, limit=1)
+        if matches:
+            return matches[0].get("name") or candidate
+    return None
 
 def router_node(state: GraphState) -> GraphState:
     """Route the query based on its intent.
@@ -96,10 +184,10 @@ def router_node(state: GraphState) -> GraphState:
         state: The current graph state.
 
     Returns:
-        Updated state with the classified intent.
+        State update with the classified intent.
     """
     intent = state.get("intent") or _classify_intent(state["user_input"])
-    return {**state, "intent": intent}
+    return {"intent": intent}
 
 def weather_node(state: GraphState) -> GraphState:
     """Process weather-related queries.
@@ -108,13 +196,13 @@ def weather_node(state: GraphState) -> GraphState:
         state: The current graph state.
 
     Returns:
-        Updated state with weather data or an error message.
+        State update with weather data or an error message.
     """
-    city = _extract_city(state["user_input"])
+    client = WeatherClient()
+    city = _extract_city(state["user_input"]) or _geocode_city(client, state["user_input"])
     if not city:
-        return {**state, "answer": "Please mention a city, e.g., “What’s the weather in Mumbai?”"}
+        return {"answer": "Please mention a city, e.g., “What’s the weather in Mumbai?”"}
 
-    client = WeatherClient()
     resp = client.fetch(city)
     if resp:
         weather = {
@@ -126,14 +214,14 @@ def weather_node(state: GraphState) -> GraphState:
             "humidity": resp.humidity,
             "wind_speed": resp.wind_speed,
         }
-        return {**state, "weather": weather}
+        return {"weather": weather}
 
     suggestions = client.search_cities(city)
     if suggestions:
         sug_text = ", ".join([f"{s['name']}, {s.get('country', '?')}" for s in suggestions])
-        return {**state, "answer": f"Couldn’t find '{city}'. Did you mean one of these? {sug_text}. Try again with a suggestion."}
+        return {"answer": f"Couldn’t find '{city}'. Did you mean one of these? {sug_text}. Try again with a suggestion."}
     
-    return {**state, "answer": f"Couldn’t fetch weather for {city} or find similar cities. Check spelling or try another city."}
+    return {"answer": f"Couldn’t fetch weather for {city} or find similar cities. Check spelling or try another city."}
 
 def rag_node(state: GraphState) -> GraphState:
     """Process document-based question-answering queries.
@@ -142,20 +230,25 @@ def rag_node(state: GraphState) -> GraphState:
         state: The current graph state.
 
     Returns:
-        Updated state with retrieved contexts and answer, or an error message.
+        State update with retrieved contexts and answer, or an error message.
     """
     try:
-        vectordb = QdrantStore()
-        embeddings = EmbeddingsProvider().get()
-        llm = LLMProvider().get()
-
-        retriever = RAGRetriever(vectordb=vectordb, embeddings=embeddings, llm=llm)
+        vectordb = get_qdrant()
+        embeddings = get_embeddings()
+        llm = get_llm()
+
+        retriever = RAGRetriever(
+            vectordb=vectordb,
+            embeddings=embeddings,
+            llm=llm,
+            sim_cache=get_similarity_cache(),
+        )
         result = retriever.retrieve(state["user_input"])
         answer_text = retriever.summarize(state["user_input"], result["contexts"])
 
-        return {**state, "retrieval": result, "answer": answer_text}
+        return {"retrieval": result, "answer": answer_text}
     except Exception as e:
-        return {**state, "retrieval": None, "answer": f"⚠️ Retrieval step failed: {e}"}
+        return {"retrieval": None, "answer": f"⚠️ Retrieval step failed: {e}"}
 
 def synthesis_node(state: GraphState) -> GraphState:
     """Synthesize the final response from weather or retrieval data.
@@ -164,7 +257,8 @@ def synthesis_node(state: GraphState) -> GraphState:
         state: The current graph state.
 
     Returns:
-        Updated state with a synthesized answer, if not already present.
+        State update with a synthesized answer, or an empty update if an answer
+        is already present.
     """
     if state.get("weather") and not state.get("answer"):
         w = state["weather"]
@@ -173,8 +267,8 @@ def synthesis_node(state: GraphState) -> GraphState:
             f"Temp {w['temp']}° ({w['feels_like']}° feels like). "
             f"Humidity {w['humidity']}%, wind {w['wind_speed']} m/s."
         )
-        return {**state, "answer": ans}
-    return state
+        return {"answer": ans}
+    return {}
 
 def route_intent(state: GraphState) -> str:
     """Determine the routing path based on the state's intent.
@@ -1,13 +1,15 @@
 import argparse
 from pathlib import Path
-from typing import List
+from itertools import islice
+from typing import Iterator, List
+import numpy as np
 from langchain_community.document_loaders import PyPDFLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
-from qdrant_client.models import PointStruct
 
 from ..llm.providers import EmbeddingsProvider
 from ..vectordb.qdrant_store import QdrantStore
+from ..rag.similarity_cache import get_similarity_cache
 from ..logging import get_logger
 
 """PDF ingestion module for RAGChain-WeatherBot.
@@ -21,71 +23,101 @@ logger = get_logger(__name__)
 
 CHUNK_SIZE = 512
 CHUNK_OVERLAP = 64
+UPLOAD_BATCH_SIZE = 256
+PAGE_BATCH_SIZE = 32
 
-def load_and_chunk_pdf(pdf_path: Path) -> List[Document]:
-    """Load and chunk a PDF document into smaller segments.
+def iter_pdf_chunks(pdf_path: Path, page_batch_size: int = PAGE_BATCH_SIZE) -> Iterator[List[Document]]:
+    """Lazily load a PDF and yield its chunks one page batch at a time.
+
+    Pages are read with PyPDFLoader.lazy_load, so at most page_batch_size pages
+    are held in memory at once.
 
     Args:
         pdf_path: Path to the PDF file.
+        page_batch_size: Number of pages to split per batch (default: PAGE_BATCH_SIZE).
 
-    Returns:
-        A list of Document objects, each representing a chunk of the PDF.
+    Yields:
+        Lists of Document objects, each list holding the chunks of one page batch.
     """
-    docs = PyPDFLoader(str(pdf_path)).load()
+    pages = PyPDFLoader(str(pdf_path)).lazy_load()
     splitter = RecursiveCharacterTextSplitter(
         chunk_size=CHUNK_SIZE,
         chunk_overlap=CHUNK_OVERLAP
     )
-    return splitter.split_documents(docs)
+    while batch := list(islice(pages, page_batch_size)):
+        yield splitter.split_documents(batch)
 
-def _to_py_floats(vec):
-    """Convert a vector to a list of pure Python floats.
+def load_and_chunk_pdf(pdf_path: Path) -> List[Document]:
+    """Load and chunk a PDF document into smaller segments.
 
     Args:
-        vec: Input vector, potentially containing numpy.float32 values.
+        pdf_path: Path to the PDF file.
 
     Returns:
-        A list of Python float values.
+        A list of Document objects, each representing a chunk of the PDF.
     """
-    return [float(v) for v in (vec.tolist() if hasattr(vec, "tolist") else vec)]
+    return [doc for batch in iter_pdf_chunks(pdf_path) for doc in batch]
 
-def embed_and_upsert(docs: List[Document], embeddings, vectordb: QdrantStore) -> None:
+def embed_and_upsert(docs: List[Document], embeddings, vectordb: QdrantStore, start_id: int = 0) -> int:
     """Embed document chunks and upload them to Qdrant.
 
+    All chunks are embedded with a single embed_documents call and converted to
+    Python floats in one pass over the stacked float32 matrix; points are then
+    upserted as parallel id/vector/payload batches of UPLOAD_BATCH_SIZE.
+
     Args:
         docs: List of Document objects to embed and upload.
         embeddings: Embeddings provider instance.
         vectordb: QdrantStore instance for vector storage.
-    """
-    points: list[PointStruct] = []
-    pid = 0
-    for i, doc in enumerate(docs):
-        vec = _to_py_floats(embeddings.embed_query(doc.page_content))
+        start_id: Point id and chunk index assigned to the first document (default: 0).
 
-        payload = {
+    Returns:
+        The number of chunks uploaded.
+    """
+    texts = [doc.page_content for doc in docs]
+    if not texts:
+        return 0
+    vecs = np.asarray(embeddings.embed_documents(texts), dtype=np.float32).tolist()
+    ids = list(range(start_id, start_id + len(docs)))
+    payloads = [
+        {
             "doc_id": doc.metadata.get("source", "unknown"),
             "page": int(doc.metadata.get("page", -1)) if str(doc.metadata.get("page", -1)).isdigit() else -1,
-            "chunk": i,
+            "chunk": pid,
             "text": doc.page_content,
         }
+        for pid, doc in zip(ids, docs)
+    ]
+
+    for lo in range(0, len(ids), UPLOAD_BATCH_SIZE):
+        hi = lo + UPLOAD_BATCH_SIZE
+        vectordb.upsert_batch(ids[lo:hi], vecs[lo:hi], payloads[lo:hi])
+    logger.info("Ingested %d chunks", len(ids))
+    return len(ids)
 
-        points.append(
-            PointStruct(
-                id=pid,
-                vector=vec,
-                payload=payload,
-            )
-        )
-        pid += 1
+def ingest_pdf(pdf_path: Path, embeddings, vectordb: QdrantStore) -> int:
+    """Stream a PDF through chunking, embedding and upload one page batch at a time.
 
-    vectordb.upload(points)
-    logger.info("Ingested %d chunks", len(points))
+    Args:
+        pdf_path: Path to the PDF file.
+        embeddings: Embeddings provider instance.
+        vectordb: QdrantStore instance for vector storage.
+
+    Returns:
+        The total number of chunks uploaded.
+    """
+    total = 0
+    for docs in iter_pdf_chunks(pdf_path):
+        total += embed_and_upsert(docs, embeddings, vectordb, start_id=total)
+    # Cached retrieval results predate the new chunks.
+    get_similarity_cache().clear()
+    return total
 
 def main():
     """Command-line interface for ingesting a PDF into Qdrant.
 
-    Parses command-line arguments, loads and chunks the PDF, embeds the chunks,
-    and uploads them to the Qdrant vector database.
+    Parses command-line arguments, then streams the PDF through chunking, embedding,
+    and upload to the Qdrant vector database.
     """
     parser = argparse.ArgumentParser()
     parser.add_argument("--pdf", type=str, required=True, help="Path to PDF file")
@@ -95,17 +127,17 @@ def main():
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    docs = load_and_chunk_pdf(pdf_path)
-
     embeddings = EmbeddingsProvider().get()
     probe = embeddings.embed_query("probe")
     probe = probe.tolist() if hasattr(probe, "tolist") else probe
     vec_size = len(probe)
 
     vectordb = QdrantStore()
-    vectordb.ensure_collection(vec_size, recreate_if_mismatch=True)
-
-    embed_and_upsert(docs, embeddings, vectordb)
+    vectordb.ensure_collection(vec_size, recreate_if_mismatch=True, bulk=True)
+    try:
+        ingest_pdf(pdf_path, embeddings, vectordb)
+    finally:
+        vectordb.finalize_bulk()
     logger.info("PDF ingestion complete.")
 
 if __name__ == "__main__":
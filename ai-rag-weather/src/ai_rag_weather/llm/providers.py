@@ -1,15 +1,21 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 import os
 
 from ai_rag_weather.config import get_settings
+from ai_rag_weather.rag.embed_cache import CachedEmbeddings
 
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 try:
     from langchain_huggingface import HuggingFaceEmbeddings
 except Exception:
     from langchain_community.embeddings import HuggingFaceEmbeddings
+try:
+    import streamlit as st
+except Exception:
+    st = None
 
 """Language model and embeddings provider for AI RAG WeatherBot.
 
@@ -18,6 +24,23 @@ based on configuration settings, supporting both OpenAI and HuggingFace models.
 It includes a utility to retrieve and validate the OpenAI API key from multiple sources.
 """
 
+@lru_cache(maxsize=1)
+def _get_openai_key_cached() -> str:
+    """Resolve the OpenAI API key from Streamlit secrets or the environment.
+
+    The result is cached, so secrets and environment variables are read once per process.
+
+    Returns:
+        The stripped API key, or an empty string if neither source provides one.
+    """
+    key = None
+    if st is not None:
+        try:
+            key = st.secrets.get("OPENAI_API_KEY")
+        except Exception:
+            pass
+    return (key or os.getenv("OPENAI_API_KEY") or "").strip()
+
 def _get_openai_key(settings):
     """Retrieve and validate the OpenAI API key from multiple sources.
 
@@ -33,14 +56,7 @@ def _get_openai_key(settings):
     Raises:
         RuntimeError: If no valid OPENAI_API_KEY is found.
     """
-    key = None
-    try:
-        import streamlit as st
-        key = st.secrets.get("OPENAI_API_KEY")
-    except Exception:
-        pass
-    key = key or os.getenv("OPENAI_API_KEY") or getattr(settings, "OPENAI_API_KEY", "")
-    key = (key or "").strip()
+    key = _get_openai_key_cached() or (getattr(settings, "OPENAI_API_KEY", "") or "").strip()
     print(f"[providers] key sources -> secrets/env/settings | present? {bool(key)}")
     if not key:
         raise RuntimeError(
@@ -52,24 +68,30 @@ def _get_openai_key(settings):
 @dataclass
 class EmbeddingsProvider:
     """Provider for text embedding models."""
-    settings: Any = get_settings()
+    settings: Any = field(default_factory=get_settings)
     def get(self):
         """Instantiate an embeddings model based on configuration.
 
         Returns:
-            An embeddings model instance (OpenAIEmbeddings or HuggingFaceEmbeddings).
+            An embeddings model instance (OpenAIEmbeddings or HuggingFaceEmbeddings),
+            wrapped in CachedEmbeddings when EMBED_CACHE_DIR is configured.
         """
         provider = (getattr(self.settings, "EMBEDDINGS_PROVIDER", "huggingface") or "huggingface").lower()
         if provider == "openai":
             model = getattr(self.settings, "OPENAI_EMBEDDINGS_MODEL", "text-embedding-3-small")
-            return OpenAIEmbeddings(model=model, openai_api_key=_get_openai_key(self.settings))
-        model_name = getattr(self.settings, "SENTENCE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
-        return HuggingFaceEmbeddings(model_name=model_name)
+            embeddings = OpenAIEmbeddings(model=model, openai_api_key=_get_openai_key(self.settings))
+        else:
+            model = getattr(self.settings, "SENTENCE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+            embeddings = HuggingFaceEmbeddings(model_name=model)
+        cache_dir = getattr(self.settings, "EMBED_CACHE_DIR", None)
+        if cache_dir:
+            return CachedEmbeddings(embeddings, cache_dir, model=model)
+        return embeddings
 
 @dataclass
 class LLMProvider:
     """Provider for language models."""
-    settings: Any = get_settings()
+    settings: Any = field(default_factory=get_settings)
     def get(self):
         """Instantiate a language model based on configuration.
 
@@ -78,4 +100,25 @@ class LLMProvider:
         """
         model = getattr(self.settings, "OPENAI_CHAT_MODEL", "gpt-4o-mini")
         temperature = float(getattr(self.settings, "OPENAI_TEMPERATURE", 0.2))
-        return ChatOpenAI(model=model, temperature=temperature, openai_api_key=_get_openai_key(self.settings))
\ No newline at end of file
+        return ChatOpenAI(model=model, temperature=temperature, openai_api_key=_get_openai_key(self.settings))
+
+@lru_cache(maxsize=1)
+def get_embeddings():
+    """Retrieve a cached embeddings model.
+
+    Builds the model once per process via EmbeddingsProvider so repeated queries
+    reuse the same client or loaded weights.
+
+    Returns:
+        An embeddings model instance (OpenAIEmbeddings or HuggingFaceEmbeddings).
+    """
+    return EmbeddingsProvider().get()
+
+@lru_cache(maxsize=1)
+def get_llm():
+    """Retrieve a cached language model.
+
+    Returns:
+        A ChatOpenAI model instance, built once per process via LLMProvider.
+    """
+    return LLMProvider().get()
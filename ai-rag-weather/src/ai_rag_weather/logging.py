@@ -9,24 +9,44 @@ This module sets up structured logging using the structlog library, integrated w
 It provides a function to configure logging with JSON output and a utility to retrieve a logger instance by name.
 """
 
+_STACK_LEVELS = frozenset({"warning", "error", "critical", "exception"})
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+def _render_stack_for_warnings(logger: Any, method_name: str, event_dict: Any) -> Any:
+    """Render stack and exception info only for warning-or-higher events.
+
+    Lower-level events drop any stack_info/exc_info keys without formatting them.
+    """
+    if event_dict.get("level") in _STACK_LEVELS:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+        return structlog.processors.format_exc_info(logger, method_name, event_dict)
+    event_dict.pop("stack_info", None)
+    event_dict.pop("exc_info", None)
+    return event_dict
+
 def setup_logging() -> None:
     """Configure structured logging with JSON output.
 
     Sets up the standard logging module with a basic configuration and configures structlog
-    to use JSON rendering, timestamps, log levels, stack information, and exception formatting.
+    to use timestamps, log levels, and stack/exception formatting for warnings and above.
+    Output is rendered as JSON, or with the plain console renderer when stdout is a TTY.
     """
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
         level=logging.INFO,
     )
+    renderer = (
+        structlog.dev.ConsoleRenderer(colors=False)
+        if sys.stdout.isatty()
+        else structlog.processors.JSONRenderer()
+    )
     structlog.configure(
         processors=[
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.stdlib.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            _render_stack_for_warnings,
+            renderer,
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+"""Persistent on-disk cache for embedding vectors.
+
+This module provides CachedEmbeddings, a wrapper around any LangChain embeddings model
+that stores each computed vector on disk under the SHA-256 of the model name and text.
+Repeated texts (re-ingested PDF chunks, repeated prompts, test re-runs) are served from
+disk instead of calling the model. Vectors are stored as float16 to halve disk usage.
+"""
+
+def _model_name(embeddings: Any) -> str:
+    """Best-effort identifier for the wrapped embeddings model.
+
+    Args:
+        embeddings: Embeddings model instance.
+
+    Returns:
+        The model name if the instance exposes one, otherwise its class name.
+    """
+    for attr in ("model", "model_name"):
+        name = getattr(embeddings, attr, None)
+        if isinstance(name, str) and name:
+            return name
+    return type(embeddings).__name__
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that persists vectors on disk, one file per text.
+
+    Files live under ``<cache_dir>/<model>/<hash[:2]>/<hash>.npy``; each model gets its own
+    subdirectory so switching models never returns vectors of the wrong space.
+    """
+    def __init__(self, embeddings: Any, cache_dir: str | Path, model: Optional[str] = None):
+        """Initialize the cache wrapper.
+
+        Args:
+            embeddings: The embeddings model to wrap.
+            cache_dir: Root directory for cached vectors; created if missing.
+            model: Model identifier used in the cache key (default: derived from embeddings).
+        """
+        self.embeddings = embeddings
+        self.model = model or _model_name(embeddings)
+        self.cache_dir = Path(cache_dir) / re.sub(r"[^A-Za-z0-9._-]+", "_", self.model)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, text: str) -> Path:
+        digest = hashlib.sha256(f"{self.model}:{text}".encode()).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.npy"
+
+    @staticmethod
+    def _load(path: Path) -> Optional[List[float]]:
+        try:
+            return np.load(path).astype(np.float32).tolist()
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _store(path: Path, vector: Any) -> List[float]:
+        """Write a vector atomically so concurrent readers never see a partial file.
+
+        Writing is best-effort: a failure (read-only or full disk) skips caching the vector.
+
+        Args:
+            path: Destination file.
+            vector: The freshly computed embedding.
+
+        Returns:
+            The vector as stored (float16 precision), so hits and misses return identical values.
+        """
+        half = np.asarray(vector, dtype=np.float16)
+        tmp = None
+        try:
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, half)
+            os.replace(tmp, path)
+        except OSError:
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+        return half.astype(np.float32).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query, reading from or populating the disk cache.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            The embedding vector.
+        """
+        path = self._path(text)
+        vec = self._load(path)
+        if vec is None:
+            vec = self._store(path, self.embeddings.embed_query(text))
+        return vec
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, sending only cache misses to the model in a single batch.
+
+        Args:
+            texts: The texts to embed.
+
+        Returns:
+            One embedding vector per text, in input order.
+        """
+        paths = [self._path(t) for t in texts]
+        vecs = [self._load(p) for p in paths]
+        missing = [i for i, v in enumerate(vecs) if v is None]
+        if missing:
+            computed = self.embeddings.embed_documents([texts[i] for i in missing])
+            for i, vec in zip(missing, computed):
+                vecs[i] = self._store(paths[i], vec)
+        return vecs
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
+import numpy as np
 from langchain_core.messages import SystemMessage, HumanMessage
+from qdrant_client import models
+from .similarity_cache import SimilarityCache
 
 """Retrieval-Augmented Generation (RAG) retriever for RAGChain-WeatherBot.
 
@@ -23,6 +26,7 @@ class RAGRetriever:
         llm: Any,
         top_k: int = 5,
         score_threshold: Optional[float] = None,
+        sim_cache: Optional[SimilarityCache] = None,
     ):
         """Initialize the RAG retriever.
 
@@ -32,42 +36,163 @@ class RAGRetriever:
             llm: Language model for generating answers.
             top_k: Number of top results to retrieve (default: 5).
             score_threshold: Minimum score threshold for retrieved results (default: None).
+            sim_cache: Optional cache answering near-duplicate queries without a vector search.
         """
         self.vectordb = vectordb
         self.embeddings = embeddings
         self.llm = llm
         self.top_k = top_k
         self.score_threshold = score_threshold
+        self.sim_cache = sim_cache
 
-    def _embed(self, text: str) -> List[float]:
+    def _embed(self, text: str) -> np.ndarray:
         """Embed a text query into a vector.
 
+        The vector is kept as a contiguous float32 array, which qdrant-client converts in
+        one call instead of coercing every Python float.
+
         Args:
             text: The input text to embed.
 
         Returns:
-            A list of floats representing the embedded vector.
+            A float32 numpy array representing the embedded vector.
         """
-        vec = self.embeddings.embed_query(text)
-        return vec.tolist() if hasattr(vec, "tolist") else vec
+        return np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+
+    @staticmethod
+    def _to_filter(filters: Optional[Dict[str, Any]]) -> Optional[models.Filter]:
+        """Translate equality filters into a Qdrant payload filter.
+
+        Args:
+            filters: Mapping of payload key to required value, e.g. {"page": 3}.
 
-    def retrieve(self, query: str) -> Dict[str, Any]:
+        Returns:
+            A Filter requiring every key to match, or None when no filters are given.
+        """
+        if not filters:
+            return None
+        return models.Filter(
+            must=[
+                models.FieldCondition(key=k, match=models.MatchValue(value=v))
+                for k, v in filters.items()
+            ]
+        )
+
+    @classmethod
+    def _filter_kwargs(cls, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Search keyword arguments for the given filters; empty when there are none,
+        so vector stores without filter support keep working unfiltered."""
+        query_filter = cls._to_filter(filters)
+        return {} if query_filter is None else {"query_filter": query_filter}
+
+    def retrieve(self, query: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Retrieve relevant contexts for a query from the vector database.
 
         Args:
             query: The input query string.
+            filters: Optional payload equality filters applied server-side, e.g. {"page": 3}.
 
         Returns:
             A dictionary containing the query and a list of contexts, where each context
             includes id, score, page, and text.
         """
         query_vec = self._embed(query)
-        hits = self.vectordb.search(
-            query_vector=query_vec,
+        scope = self._cache_scope(filters)
+        hits = self._cached_hits(query_vec, scope)
+        if hits is None:
+            hits = self.vectordb.search(
+                query_vector=query_vec,
+                top_k=self.top_k,
+                score_threshold=self.score_threshold,
+                **self._filter_kwargs(filters),
+            )
+            self._cache_hits(query_vec, hits, scope)
+        return {"query": query, "contexts": self._to_contexts(hits)}
+
+    def retrieve_many(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Retrieve contexts for several queries with one embedding call and one search request.
+
+        Args:
+            queries: The input query strings, e.g. rewrites of a single user question.
+
+        Returns:
+            One dictionary per query, in input order, shaped like the result of retrieve().
+        """
+        if not queries:
+            return []
+        query_vecs = np.asarray(self.embeddings.embed_documents(queries), dtype=np.float32)
+        results = self.vectordb.search_batch(
+            query_vecs,
             top_k=self.top_k,
             score_threshold=self.score_threshold,
         )
+        return [
+            {"query": q, "contexts": self._to_contexts(hits)}
+            for q, hits in zip(queries, results)
+        ]
 
+    async def aretrieve(self, query: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Retrieve relevant contexts for a query using the vector database's async search.
+
+        Args:
+            query: The input query string.
+            filters: Optional payload equality filters applied server-side, e.g. {"page": 3}.
+
+        Returns:
+            A dictionary containing the query and a list of contexts, as in retrieve().
+        """
+        query_vec = self._embed(query)
+        scope = self._cache_scope(filters)
+        hits = self._cached_hits(query_vec, scope)
+        if hits is None:
+            hits = await self.vectordb.asearch(
+                query_vector=query_vec,
+                top_k=self.top_k,
+                score_threshold=self.score_threshold,
+                **self._filter_kwargs(filters),
+            )
+            self._cache_hits(query_vec, hits, scope)
+        return {"query": query, "contexts": self._to_contexts(hits)}
+
+    def _cache_scope(self, filters: Optional[Dict[str, Any]] = None) -> tuple:
+        """Similarity-cache scope: hits are only reused under identical search settings."""
+        return (self.top_k, self.score_threshold, tuple(sorted((filters or {}).items())))
+
+    def _cached_hits(self, query_vec: np.ndarray, scope: tuple) -> Optional[List[Dict[str, Any]]]:
+        """Look up hits cached for a near-identical query with the same search settings.
+
+        Args:
+            query_vec: The embedded query.
+            scope: Search settings the hits must have been produced with.
+
+        Returns:
+            The cached hits, or None on a miss or when no cache is configured.
+        """
+        if self.sim_cache is None:
+            return None
+        return self.sim_cache.lookup(query_vec, scope=scope)
+
+    def _cache_hits(self, query_vec: np.ndarray, hits: List[Dict[str, Any]], scope: tuple) -> None:
+        """Store non-empty hits in the similarity cache, if one is configured.
+
+        Args:
+            query_vec: The embedded query.
+            hits: Search results for the query.
+            scope: Search settings the hits were produced with.
+        """
+        if self.sim_cache is not None and hits:
+            self.sim_cache.insert(query_vec, hits, scope=scope)
+
+    @staticmethod
+    def _to_contexts(hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert vector search hits into context dictionaries.
+
+        Args:
+            hits: Search results, each with id, score, and payload.
+
+        Returns:
+            A list of contexts, each including id, score, page, and text.
+        """
         contexts: List[Dict[str, Any]] = []
         for h in hits:
             payload = h.get("payload", {}) or {}
@@ -79,7 +204,7 @@ class RAGRetriever:
                     "text": payload.get("text") or "",
                 }
             )
-        return {"query": query, "contexts": contexts}
+        return contexts
 
     def summarize(self, query: str, contexts: List[Dict[str, Any]]) -> str:
         """Generate a concise answer using retrieved contexts.
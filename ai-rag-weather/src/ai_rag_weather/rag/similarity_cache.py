@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Sequence
+import numpy as np
+
+"""Semantic similarity cache for vector search results.
+
+This module provides a SimilarityCache that maps query embeddings to previously
+computed search results. A lookup returns the cached results of the most similar
+stored query when its cosine similarity clears a threshold, so near-duplicate
+questions skip the vector database round-trip. Entries are evicted least recently
+used first and expire after a TTL, so results do not outlive a re-ingestion done by
+another process (e.g. the ingestion CLI while the Streamlit app keeps running).
+"""
+
+DEFAULT_THRESHOLD = 0.97
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TTL = 300.0
+
+class SimilarityCache:
+    """Bounded LRU cache keyed by embedding similarity rather than exact equality.
+
+    Stored keys are unit-normalised rows of a preallocated matrix, so a lookup is a
+    single matrix-vector product over the filled rows. A scope (e.g. top_k and score
+    threshold) can be attached to each entry; lookups only match entries of the same scope.
+    """
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: float = DEFAULT_TTL,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached queries (default: 1024).
+            threshold: Minimum cosine similarity for a cache hit (default: 0.97).
+            ttl: Seconds an entry may answer lookups after insertion (default: 300).
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._keys: Optional[np.ndarray] = None
+        self._scopes = np.zeros(self.maxsize, dtype=np.int32)
+        self._expires = np.zeros(self.maxsize, dtype=np.float64)
+        self._scope_ids: Dict[Hashable, int] = {}
+        self._entries: OrderedDict[int, Any] = OrderedDict()
+
+    def clear(self) -> None:
+        """Drop every cached entry, e.g. after the underlying collection changes."""
+        with self._lock:
+            self._reset()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Optional[np.ndarray]:
+        vec = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 0 else None
+
+    def lookup(
+        self,
+        vector: Sequence[float],
+        scope: Hashable = None,
+        threshold: Optional[float] = None,
+    ) -> Optional[Any]:
+        """Return the value cached for the most similar stored query, if close enough.
+
+        Args:
+            vector: Query embedding.
+            scope: Only entries inserted with an equal scope are considered.
+            threshold: Minimum cosine similarity for a hit (default: the cache's threshold).
+
+        Returns:
+            The cached value on a hit, otherwise None.
+        """
+        q = self._normalize(vector)
+        with self._lock:
+            sid = self._scope_ids.get(scope)
+            n = len(self._entries)
+            if q is None or sid is None or n == 0 or self._keys.shape[1] != q.shape[0]:
+                return None
+            sims = self._keys[:n] @ q
+            sims[(self._scopes[:n] != sid) | (self._expires[:n] <= time.monotonic())] = -np.inf
+            slot = int(np.argmax(sims))
+            if sims[slot] < (self.threshold if threshold is None else threshold):
+                return None
+            self._entries.move_to_end(slot)
+            return self._entries[slot]
+
+    def insert(self, vector: Sequence[float], value: Any, scope: Hashable = None) -> None:
+        """Cache a value under a query embedding, evicting the least recently used entry if full.
+
+        Args:
+            vector: Query embedding.
+            value: Value to return for similar queries, e.g. search hits.
+            scope: Scope the entry belongs to.
+        """
+        q = self._normalize(vector)
+        if q is None:
+            return
+        with self._lock:
+            if self._keys is None or self._keys.shape[1] != q.shape[0]:
+                self._keys = np.zeros((self.maxsize, q.shape[0]), dtype=np.float32)
+                self._entries.clear()
+            if len(self._entries) < self.maxsize:
+                slot = len(self._entries)
+            else:
+                slot, _ = self._entries.popitem(last=False)
+            self._keys[slot] = q
+            self._scopes[slot] = self._scope_ids.setdefault(scope, len(self._scope_ids))
+            self._expires[slot] = time.monotonic() + self.ttl
+            self._entries[slot] = value
+
+@lru_cache(maxsize=1)
+def get_similarity_cache() -> SimilarityCache:
+    """Retrieve the process-wide similarity cache for retrieval results.
+
+    Returns:
+        A SimilarityCache shared by all retrievers in the process.
+    """
+    return SimilarityCache()
@@ -12,7 +12,8 @@ from typing import Any, Dict, List, Optional
 import streamlit as st
 from ai_rag_weather.config import get_settings
 from ai_rag_weather.graph.graph import build_graph
-from ai_rag_weather.ingestion.pdf_ingest import load_and_chunk_pdf, embed_and_upsert
+from ai_rag_weather.graph.nodes import STATE_TEMPLATE
+from ai_rag_weather.ingestion.pdf_ingest import ingest_pdf
 from ai_rag_weather.llm.providers import EmbeddingsProvider
 from ai_rag_weather.vectordb.qdrant_store import QdrantStore
 from ai_rag_weather.logging import get_logger
@@ -55,16 +56,18 @@ with st.sidebar:
             with open(pdf_path, "wb") as f:
                 f.write(uploaded.read())
 
-            docs = load_and_chunk_pdf(pdf_path)
             embeddings = EmbeddingsProvider().get()
             probe = embeddings.embed_query("probe")
             if hasattr(probe, "tolist"):
                 probe = probe.tolist()
             vec_size = len(probe)
             vectordb = QdrantStore(check_compatibility=False)
-            vectordb.ensure_collection(vec_size, recreate_if_mismatch=True)
-            embed_and_upsert(docs, embeddings, vectordb)
-            st.success(f"Ingested {len(docs)} chunks from {uploaded.name}")
+            vectordb.ensure_collection(vec_size, recreate_if_mismatch=True, bulk=True)
+            try:
+                count = ingest_pdf(pdf_path, embeddings, vectordb)
+            finally:
+                vectordb.finalize_bulk()
+            st.success(f"Ingested {count} chunks from {uploaded.name}")
         except Exception as e:
             logger.exception("PDF ingestion failed")
             st.error(f"PDF ingestion failed: {e}")
@@ -109,11 +112,9 @@ st.markdown("---")
 prompt = st.chat_input("Ask about the weather or your PDF…")
 if prompt:
     state: Dict[str, Any] = {
+        **STATE_TEMPLATE,
         "user_input": prompt,
         "intent": "weather" if st.session_state.force_weather else None,
-        "weather": None,
-        "answer": None,
-        "retrieval": None,
         "temperature": float(st.session_state.temperature),
         "top_k": int(st.session_state.top_k),
         "enable_tracing": bool(enable_tracing),
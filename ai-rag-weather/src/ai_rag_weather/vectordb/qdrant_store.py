@@ -1,24 +1,76 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
-from qdrant_client import QdrantClient
+import asyncio
+import os
+from operator import attrgetter
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Sequence, Union
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
 from qdrant_client.models import Distance, VectorParams, PointStruct
 from qdrant_client.http.exceptions import UnexpectedResponse
+from ai_rag_weather.config import get_settings
 
 """Qdrant vector database wrapper for RAGChain-WeatherBot.
 
 This module provides a QdrantStore class to manage vector collections, including creation,
-upserts, uploads, and similarity searches. It ensures compatibility with older Qdrant servers
-and handles vector size validation.
+upserts, uploads, and similarity searches, and handles vector size validation. Searches use
+the Query API, so Qdrant server 1.10 or newer is required. Async counterparts of search/upsert go through a gRPC
+AsyncQdrantClient, one per event loop, so concurrent requests on a loop share one channel.
 """
 
 COLLECTION_NAME = "ai_rag_weather_docs"
+# Qdrant's server-side default (OptimizersConfig.indexing_threshold), restored after a bulk
+# load into a collection this store created itself.
+DEFAULT_INDEXING_THRESHOLD = 10000
+
+# Payload keys the retriever reads; everything else stays on the server.
+DEFAULT_PAYLOAD_FIELDS = ("text", "page")
+
+# Query vectors may be plain float sequences or numpy arrays (the retriever passes float32 rows).
+QueryVector = Union[Sequence[float], np.ndarray]
+QueryVectors = Union[Sequence[Sequence[float]], np.ndarray]
+
+_hit_fields = attrgetter("id", "score", "payload")
+
+_INT8_QUANTIZATION = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(
+        type=models.ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True,
+    )
+)
+_QUANTIZATION_SEARCH = models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+
+@lru_cache(maxsize=32)
+def _search_params(hnsw_ef: Optional[int] = None) -> models.SearchParams:
+    """Build (and cache) search params for a given HNSW ef.
+
+    Args:
+        hnsw_ef: Candidate list size for HNSW traversal; None keeps the collection default.
+
+    Returns:
+        SearchParams using approximate search with int8 rescoring.
+    """
+    return models.SearchParams(hnsw_ef=hnsw_ef, exact=False, quantization=_QUANTIZATION_SEARCH)
+
+@lru_cache(maxsize=32)
+def _payload_selector(fields: tuple[str, ...]) -> models.PayloadSelectorInclude:
+    """Build (and cache) a payload projection for the given keys.
+
+    Args:
+        fields: Payload keys to return with each hit.
+
+    Returns:
+        A PayloadSelectorInclude for use as with_payload.
+    """
+    return models.PayloadSelectorInclude(include=list(fields))
 
 class QdrantStore:
     """Wrapper for Qdrant vector database operations.
 
     Manages vector collections with support for creation, upserting, uploading, and searching.
-    Ensures backwards compatibility with older Qdrant servers (e.g., 1.7.x).
+    Requires Qdrant server 1.10 or newer, since searches go through the Query API.
     """
     def __init__(
         self,
@@ -26,21 +78,84 @@ class QdrantStore:
         api_key: Optional[str] = None,
         prefer_grpc: bool = False,
         check_compatibility: bool = False,
+        hnsw_ef: Optional[int] = None,
     ):
         """Initialize the Qdrant client.
 
+        The sync client is created immediately; the async gRPC client is created on
+        first use of an async method in each event loop.
+
         Args:
             url: Qdrant server URL (defaults to 'http://127.0.0.1:6333').
             api_key: Optional Qdrant API key.
             prefer_grpc: Whether to prefer gRPC over HTTP (default: False).
             check_compatibility: Whether to check server compatibility (default: False).
+            hnsw_ef: Default HNSW ef for searches; None uses the collection's setting.
         """
+        self.url = url or "http://127.0.0.1:6333"
+        self.api_key = api_key
+        self.check_compatibility = check_compatibility
         self.client = QdrantClient(
-            url or "http://127.0.0.1:6333",
+            self.url,
             api_key=api_key,
             prefer_grpc=prefer_grpc,
             check_compatibility=check_compatibility,
         )
+        self._aclient: Optional[AsyncQdrantClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cached_size: Optional[int] = None
+        self._bulk_indexing_threshold: Optional[int] = None
+        self.hnsw_ef = hnsw_ef
+
+    @property
+    def aclient(self) -> AsyncQdrantClient:
+        """Async gRPC client for the running event loop.
+
+        A grpc.aio channel only works on the loop it was first used on, so a new client is
+        created whenever the store is used from a different loop (e.g. successive
+        asyncio.run calls). Must be accessed from within a coroutine.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = AsyncQdrantClient(
+                self.url,
+                api_key=self.api_key,
+                prefer_grpc=True,
+                check_compatibility=self.check_compatibility,
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop, if one was created."""
+        if self._aclient is not None and self._aclient_loop is asyncio.get_running_loop():
+            await self._aclient.close()
+        self._aclient = None
+        self._aclient_loop = None
+
+    async def __aenter__(self) -> "QdrantStore":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _params(self, hnsw_ef: Optional[int]) -> models.SearchParams:
+        return _search_params(hnsw_ef if hnsw_ef is not None else self.hnsw_ef)
+
+    @staticmethod
+    def _to_hits(results) -> List[Dict[str, Any]]:
+        """Convert scored points into result dictionaries.
+
+        Args:
+            results: Scored points returned by a Qdrant search.
+
+        Returns:
+            A list of dictionaries containing id, score, payload, and text.
+        """
+        return [
+            {"id": i, "score": s, "payload": p, "text": p.get("text")}
+            for i, s, p in map(_hit_fields, results)
+        ]
 
     def _extract_vector_size(self, vectors_cfg) -> Optional[int]:
         """Extract vector size from the collection's vector configuration.
@@ -51,13 +166,11 @@ class QdrantStore:
         Returns:
             The vector size if found, otherwise None.
         """
-        if isinstance(vectors_cfg, VectorParams):
-            return vectors_cfg.size
-        if isinstance(vectors_cfg, dict):
-            key = next(iter(vectors_cfg))
-            vp = vectors_cfg[key]
-            if isinstance(vp, VectorParams):
-                return vp.size
+        size = getattr(vectors_cfg, "size", None)
+        if size is not None:
+            return size
+        if isinstance(vectors_cfg, dict) and vectors_cfg:
+            return getattr(next(iter(vectors_cfg.values())), "size", None)
         return None
 
     def _get_vectors_config(self):
@@ -75,9 +188,14 @@ class QdrantStore:
     def _get_size_if_exists(self) -> Optional[int]:
         """Get the vector size of an existing collection.
 
+        The size is cached on the instance after the first successful lookup, and kept
+        in sync by ensure_collection when it creates or deletes the collection.
+
         Returns:
             The vector size if the collection exists, otherwise None.
         """
+        if self._cached_size is not None:
+            return self._cached_size
         try:
             vectors_cfg = self._get_vectors_config()
         except UnexpectedResponse as e:
@@ -88,7 +206,8 @@ class QdrantStore:
             return None
         if vectors_cfg is None:
             return None
-        return self._extract_vector_size(vectors_cfg)
+        self._cached_size = self._extract_vector_size(vectors_cfg)
+        return self._cached_size
 
     def ensure_collection(
         self,
@@ -96,24 +215,35 @@ class QdrantStore:
         *,
         recreate_if_mismatch: bool = True,
         distance: Distance = Distance.COSINE,
+        bulk: bool = False,
+        quantize: bool = True,
     ) -> None:
         """Ensure a collection exists with the specified vector size.
 
         Creates a new collection if it doesn't exist or recreates it if the vector size
-        mismatches and recreate_if_mismatch is True.
+        mismatches and recreate_if_mismatch is True. With bulk=True, HNSW indexing is
+        disabled until finalize_bulk() is called. New collections keep an int8 scalar-quantized
+        copy of the vectors in RAM unless quantize is False.
 
         Args:
             vector_size: The size of the vectors for the collection.
             recreate_if_mismatch: Whether to recreate the collection if vector sizes mismatch (default: True).
             distance: The distance metric for the collection (default: COSINE).
+            bulk: Whether to defer indexing for a bulk load (default: False).
+            quantize: Whether to enable int8 scalar quantization on creation (default: True).
         """
         current_size = self._get_size_if_exists()
+        optimizers_config = models.OptimizersConfigDiff(indexing_threshold=0) if bulk else None
+        quantization_config = _INT8_QUANTIZATION if quantize else None
 
         if current_size is None:
             self.client.create_collection(
                 collection_name=COLLECTION_NAME,
                 vectors_config=VectorParams(size=vector_size, distance=distance),
+                optimizers_config=optimizers_config,
+                quantization_config=quantization_config,
             )
+            self._cached_size = vector_size
             return
 
         if current_size != vector_size:
@@ -122,10 +252,39 @@ class QdrantStore:
                     f"Collection vector size mismatch: existing={current_size}, new={vector_size}"
                 )
             self.client.delete_collection(COLLECTION_NAME)
+            self._cached_size = None
             self.client.create_collection(
                 collection_name=COLLECTION_NAME,
                 vectors_config=VectorParams(size=vector_size, distance=distance),
+                optimizers_config=optimizers_config,
+                quantization_config=quantization_config,
             )
+            self._cached_size = vector_size
+            return
+
+        if bulk:
+            info = self.client.get_collection(COLLECTION_NAME)
+            threshold = info.config.optimizer_config.indexing_threshold
+            # 0 means an earlier bulk load is still open (or never finalized); keep what we have.
+            if threshold:
+                self._bulk_indexing_threshold = threshold
+            self.client.update_collection(COLLECTION_NAME, optimizers_config=optimizers_config)
+
+    def finalize_bulk(self, indexing_threshold: Optional[int] = None) -> None:
+        """Re-enable HNSW indexing after a bulk load started with ensure_collection(bulk=True).
+
+        Args:
+            indexing_threshold: Indexing threshold to set (default: the value the collection had
+                before ensure_collection(bulk=True), or DEFAULT_INDEXING_THRESHOLD for a
+                collection created by that call).
+        """
+        if indexing_threshold is None:
+            indexing_threshold = self._bulk_indexing_threshold or DEFAULT_INDEXING_THRESHOLD
+        self.client.update_collection(
+            COLLECTION_NAME,
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=indexing_threshold),
+        )
+        self._bulk_indexing_threshold = None
 
     def upsert(self, points: List[PointStruct]):
         """Upsert a list of points into the Qdrant collection.
@@ -138,6 +297,32 @@ class QdrantStore:
         """
         return self.client.upsert(collection_name=COLLECTION_NAME, points=points)
 
+    def upsert_batch(
+        self,
+        ids: List[int],
+        vectors: List[List[float]],
+        payloads: List[Dict[str, Any]],
+        wait: bool = True,
+    ):
+        """Upsert points given as parallel id, vector and payload lists.
+
+        Sends a single models.Batch instead of building one PointStruct per point.
+
+        Args:
+            ids: Point ids.
+            vectors: Vectors, aligned with ids.
+            payloads: Payload dictionaries, aligned with ids.
+            wait: Whether to wait for the upsert to complete (default: True).
+
+        Returns:
+            The result of the upsert operation.
+        """
+        return self.client.upsert(
+            collection_name=COLLECTION_NAME,
+            points=models.Batch(ids=ids, vectors=vectors, payloads=payloads),
+            wait=wait,
+        )
+
     def upload(self, points: List[PointStruct], wait: bool = True):
         """Upload a list of points to the Qdrant collection.
 
@@ -154,35 +339,163 @@ class QdrantStore:
             wait=wait,
         )
 
+    def bulk_upload(
+        self,
+        vectors: List[List[float]],
+        payloads: List[Dict[str, Any]],
+        ids: Optional[List[int]] = None,
+        parallel: Optional[int] = None,
+        batch_size: int = 256,
+    ) -> None:
+        """Upload a large set of points with parallel worker processes.
+
+        Args:
+            vectors: Vectors to upload.
+            payloads: Payload dictionaries, aligned with vectors.
+            ids: Optional point ids, aligned with vectors (default: auto-generated).
+            parallel: Number of worker processes (default: os.cpu_count()).
+            batch_size: Number of points per request (default: 256).
+        """
+        self.client.upload_collection(
+            collection_name=COLLECTION_NAME,
+            vectors=vectors,
+            payload=payloads,
+            ids=ids,
+            parallel=parallel or os.cpu_count() or 1,
+            batch_size=batch_size,
+            wait=True,
+        )
+
     def search(
         self,
-        query_vector: List[float],
+        query_vector: QueryVector,
         top_k: int = 5,
         score_threshold: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        payload_fields: Sequence[str] = DEFAULT_PAYLOAD_FIELDS,
+        query_filter: Optional[models.Filter] = None,
     ) -> List[Dict[str, Any]]:
         """Perform a vector similarity search in the Qdrant collection.
 
+        Uses the Query API, which requires Qdrant server 1.10 or newer.
+
         Args:
             query_vector: The query vector for similarity search.
             top_k: Number of top results to return (default: 5).
             score_threshold: Minimum score threshold for results (default: None).
+            hnsw_ef: HNSW ef for this call; lower is faster, higher improves recall
+                (default: the store's hnsw_ef).
+            payload_fields: Payload keys to fetch with each hit (default: text and page).
+            query_filter: Payload filter evaluated by Qdrant during the search (default: None).
 
         Returns:
             A list of dictionaries containing search results with id, score, payload, and text.
         """
-        results = self.client.search(
+        response = self.client.query_points(
             collection_name=COLLECTION_NAME,
-            query_vector=query_vector,
+            query=query_vector,
             limit=top_k,
             score_threshold=score_threshold,
-            with_payload=True,
+            query_filter=query_filter,
+            with_payload=_payload_selector(tuple(payload_fields)),
+            search_params=self._params(hnsw_ef),
         )
-        return [
-            {
-                "id": hit.id,
-                "score": hit.score,
-                "payload": hit.payload,
-                "text": hit.payload.get("text"),
-            }
-            for hit in results
+        return self._to_hits(response.points)
+
+    def search_batch(
+        self,
+        query_vectors: QueryVectors,
+        top_k: int = 5,
+        score_threshold: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        payload_fields: Sequence[str] = DEFAULT_PAYLOAD_FIELDS,
+        query_filter: Optional[models.Filter] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several vector similarity searches in a single request.
+
+        Uses the Query API, which requires Qdrant server 1.10 or newer.
+
+        Args:
+            query_vectors: The query vectors, one search per vector.
+            top_k: Number of top results to return per query (default: 5).
+            score_threshold: Minimum score threshold for results (default: None).
+            hnsw_ef: HNSW ef for this call; lower is faster, higher improves recall
+                (default: the store's hnsw_ef).
+            payload_fields: Payload keys to fetch with each hit (default: text and page).
+            query_filter: Payload filter evaluated by Qdrant during the search (default: None).
+
+        Returns:
+            One list of result dictionaries per query vector, in input order.
+        """
+        params = self._params(hnsw_ef)
+        with_payload = _payload_selector(tuple(payload_fields))
+        requests = [
+            models.QueryRequest(
+                query=v,
+                limit=top_k,
+                score_threshold=score_threshold,
+                filter=query_filter,
+                with_payload=with_payload,
+                params=params,
+            )
+            for v in query_vectors
         ]
+        responses = self.client.query_batch_points(collection_name=COLLECTION_NAME, requests=requests)
+        return [self._to_hits(r.points) for r in responses]
+
+    async def aupsert(self, points: List[PointStruct], wait: bool = True):
+        """Upsert a list of points through the async gRPC client.
+
+        Args:
+            points: List of PointStruct objects to upsert.
+            wait: Whether to wait for the upsert to complete (default: True).
+
+        Returns:
+            The result of the upsert operation.
+        """
+        return await self.aclient.upsert(collection_name=COLLECTION_NAME, points=points, wait=wait)
+
+    async def asearch(
+        self,
+        query_vector: QueryVector,
+        top_k: int = 5,
+        score_threshold: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        payload_fields: Sequence[str] = DEFAULT_PAYLOAD_FIELDS,
+        query_filter: Optional[models.Filter] = None,
+    ) -> List[Dict[str, Any]]:
+        """Perform a vector similarity search through the async gRPC client.
+
+        Uses the Query API, which requires Qdrant server 1.10 or newer.
+
+        Args:
+            query_vector: The query vector for similarity search.
+            top_k: Number of top results to return (default: 5).
+            score_threshold: Minimum score threshold for results (default: None).
+            hnsw_ef: HNSW ef for this call; lower is faster, higher improves recall
+                (default: the store's hnsw_ef).
+            payload_fields: Payload keys to fetch with each hit (default: text and page).
+            query_filter: Payload filter evaluated by Qdrant during the search (default: None).
+
+        Returns:
+            A list of dictionaries containing search results with id, score, payload, and text.
+        """
+        response = await self.aclient.query_points(
+            collection_name=COLLECTION_NAME,
+            query=query_vector,
+            limit=top_k,
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            with_payload=_payload_selector(tuple(payload_fields)),
+            search_params=self._params(hnsw_ef),
+        )
+        return self._to_hits(response.points)
+
+@lru_cache(maxsize=1)
+def get_qdrant() -> QdrantStore:
+    """Retrieve a cached QdrantStore.
+
+    Returns:
+        A QdrantStore with default connection settings, shared across the process.
+    """
+    return QdrantStore(hnsw_ef=get_settings().QDRANT_HNSW_EF)
@@ -0,0 +1,68 @@
+"""Static set of well-known city names used for city extraction.
+
+Names are lowercased; multi-word names are joined with single spaces. The set is a
+fast path only: cities that are not listed are resolved through the geocoding API.
+Names that double as everyday English words (e.g. "Nice") are left out.
+"""
+
+KNOWN_CITIES = frozenset({
+    # India
+    "agra", "ahmedabad", "allahabad", "amritsar", "aurangabad", "bangalore", "bengaluru",
+    "bhopal", "bhubaneswar", "chandigarh", "chennai", "coimbatore", "dehradun", "delhi",
+    "dhanbad", "faridabad", "ghaziabad", "goa", "guwahati", "gwalior", "hyderabad",
+    "indore", "jabalpur", "jaipur", "jammu", "jodhpur", "kanpur", "kochi", "kolkata",
+    "kota", "kozhikode", "lucknow", "ludhiana", "madurai", "mangalore", "meerut",
+    "mumbai", "mysore", "mysuru", "nagpur", "nashik", "navi mumbai", "new delhi", "noida",
+    "patna", "pondicherry", "prayagraj", "pune", "raipur", "rajkot", "ranchi", "shimla",
+    "srinagar", "surat", "thane", "thiruvananthapuram", "tirupati", "trichy", "udaipur",
+    "vadodara", "varanasi", "vijayawada", "visakhapatnam", "warangal",
+    # Rest of Asia
+    "abu dhabi", "almaty", "amman", "ankara", "baghdad", "baku", "bangkok", "beijing",
+    "beirut", "busan", "chengdu", "chittagong", "chongqing", "colombo", "daegu", "dhaka",
+    "doha", "dubai", "guangzhou", "hanoi", "ho chi minh city", "hong kong", "incheon",
+    "islamabad", "istanbul", "izmir", "jakarta", "jeddah", "jerusalem", "kabul",
+    "karachi", "kathmandu", "kuala lumpur", "kuwait city", "kyoto", "lahore", "macau",
+    "manila", "mecca", "medina", "muscat", "nagoya", "osaka", "peshawar", "phnom penh",
+    "riyadh", "sapporo", "seoul", "shanghai", "sharjah", "shenzhen", "singapore",
+    "taipei", "tashkent", "tehran", "tel aviv", "thimphu", "tianjin", "tokyo", "ulaanbaatar",
+    "wuhan", "xian", "yangon", "yokohama",
+    # Europe
+    "amsterdam", "antwerp", "athens", "barcelona", "belfast", "belgrade", "bergen",
+    "berlin", "bern", "bilbao", "birmingham", "bologna", "bordeaux", "bratislava",
+    "brighton", "bristol", "brussels", "bucharest", "budapest", "cambridge", "cardiff",
+    "cologne", "copenhagen", "cork", "dortmund", "dresden", "dublin", "dusseldorf",
+    "edinburgh", "florence", "frankfurt", "geneva", "genoa", "glasgow", "gothenburg",
+    "hamburg", "helsinki", "kazan", "kharkiv", "kiev", "krakow", "kyiv", "leeds",
+    "leipzig", "lisbon", "liverpool", "ljubljana", "london", "luxembourg", "lyon",
+    "madrid", "malaga", "manchester", "marseille", "milan", "minsk", "monaco", "moscow",
+    "munich", "naples", "novosibirsk", "odesa", "oslo", "oxford", "palermo",
+    "paris", "porto", "prague", "reykjavik", "riga", "rome", "rotterdam",
+    "saint petersburg", "salzburg", "sarajevo", "seville", "sofia", "st petersburg",
+    "stockholm", "strasbourg", "stuttgart", "tallinn", "the hague", "thessaloniki",
+    "toulouse", "turin", "valencia", "venice", "vienna", "vilnius", "warsaw", "zagreb",
+    "zurich",
+    # Africa
+    "abidjan", "abuja", "accra", "addis ababa", "alexandria", "algiers", "cairo",
+    "cape town", "casablanca", "dakar", "dar es salaam", "durban", "harare",
+    "johannesburg", "kampala", "khartoum", "kigali", "kinshasa", "lagos", "luanda",
+    "lusaka", "marrakesh", "mombasa", "nairobi", "pretoria", "rabat", "tunis",
+    # North America
+    "anchorage", "atlanta", "austin", "baltimore", "boston", "calgary", "charlotte",
+    "chicago", "cincinnati", "cleveland", "columbus", "dallas", "denver", "detroit",
+    "edmonton", "el paso", "fort worth", "guadalajara", "halifax", "havana", "honolulu",
+    "houston", "indianapolis", "jacksonville", "kansas city", "las vegas", "los angeles",
+    "memphis", "mexico city", "miami", "milwaukee", "minneapolis", "monterrey",
+    "montreal", "nashville", "new orleans", "new york", "new york city", "newark",
+    "oakland", "oklahoma city", "orlando", "ottawa", "panama city", "philadelphia",
+    "phoenix", "pittsburgh", "portland", "quebec city", "raleigh", "sacramento",
+    "salt lake city", "san antonio", "san diego", "san francisco", "san jose",
+    "san juan", "seattle", "st louis", "tampa", "tijuana", "toronto", "tucson",
+    "vancouver", "washington", "winnipeg",
+    # South America
+    "asuncion", "bogota", "brasilia", "buenos aires", "caracas", "cordoba", "cusco",
+    "guayaquil", "la paz", "lima", "medellin", "montevideo", "quito", "recife",
+    "rio de janeiro", "salvador", "santiago", "sao paulo",
+    # Oceania
+    "adelaide", "auckland", "brisbane", "canberra", "christchurch", "darwin", "hobart",
+    "melbourne", "perth", "suva", "sydney", "wellington",
+})
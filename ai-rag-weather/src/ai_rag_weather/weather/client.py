@@ -1,7 +1,12 @@
+import atexit
+import threading
+import time
 import httpx
+import orjson
+from cachetools import TTLCache
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential, retry_if_exception_type
 from ai_rag_weather.config import get_settings
 from ..logging import get_logger
 
@@ -14,6 +19,7 @@ structured data validation.
 """
 
 logger = get_logger(__name__)
+_SETTINGS = get_settings()
 
 class WeatherResponse(BaseModel):
     """Pydantic model for structuring weather API responses.
@@ -38,26 +44,81 @@ class WeatherResponse(BaseModel):
     raw: Dict[str, Any]
 
 _network_errors = (httpx.ConnectError, httpx.ReadTimeout, httpx.NetworkError, httpx.RemoteProtocolError)
+_MAX_ATTEMPTS = 3
+_BACKOFF = 0.5
+# Template for async retries; back-off awaits asyncio.sleep so the event loop keeps running.
+# Use a .copy() per call, since AsyncRetrying keeps per-run state.
+_ASYNC_RETRY = AsyncRetrying(
+    stop=stop_after_attempt(_MAX_ATTEMPTS),
+    wait=wait_exponential(multiplier=_BACKOFF),
+    retry=retry_if_exception_type(_network_errors),
+    reraise=True,
+)
+
+WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+GEO_URL = "http://api.openweathermap.org/geo/1.0/direct"
+
+_limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_shared_client = httpx.Client(timeout=5.0, http2=True, limits=_limits)
+atexit.register(_shared_client.close)
+
+# Successful lookups are reused for a few minutes; failures (None) are never cached.
+_weather_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_weather_cache_lock = threading.Lock()
+
+def _cache_key(city: str, units: str) -> tuple[str, str]:
+    return city.strip().lower(), units
+
+def _cached_weather(key: tuple[str, str]) -> Optional["WeatherResponse"]:
+    with _weather_cache_lock:
+        return _weather_cache.get(key)
+
+def _store_weather(key: tuple[str, str], weather: "WeatherResponse") -> None:
+    with _weather_cache_lock:
+        _weather_cache[key] = weather
+
+def _to_weather_response(data: Dict[str, Any]) -> Optional[WeatherResponse]:
+    """Build a WeatherResponse from a raw OpenWeatherMap payload.
+
+    The normal validating constructor is kept on purpose: with pydantic-core it is
+    faster than model_construct, which assigns fields in Python.
+
+    Args:
+        data: Parsed JSON body of a current-weather response.
+
+    Returns:
+        A WeatherResponse populated from the payload, or None if a field is missing.
+    """
+    try:
+        main = data["main"]
+        return WeatherResponse(
+            city=data["name"],
+            country=data["sys"]["country"],
+            temp=main["temp"],
+            feels_like=main["feels_like"],
+            description=data["weather"][0]["description"],
+            humidity=main["humidity"],
+            wind_speed=data["wind"]["speed"],
+            raw=data,
+        )
+    except (KeyError, IndexError) as e:
+        logger.error("Weather API payload missing field", detail=repr(e))
+        return None
 
 class WeatherClient:
     """Client for interacting with the OpenWeatherMap API.
 
-    Initializes an HTTP client with configuration settings and provides methods to
-    fetch weather data and search for cities.
+    Uses a process-wide HTTP/2 client with keep-alive, shared by all instances, and
+    provides methods to fetch weather data and search for cities.
     """
     def __init__(self):
-        self.settings = get_settings()
-        self.base_url = "https://api.openweathermap.org/data/2.5/weather"
-        self.api_key = self.settings.OPENWEATHER_API_KEY
-        self.units = self.settings.OPENWEATHER_UNITS
-        self.client = httpx.Client(timeout=5.0)
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5),
-        retry=retry_if_exception_type(_network_errors),
-        reraise=True
-    )
+        self.settings = _SETTINGS
+        self.base_url = WEATHER_URL
+        self.api_key = _SETTINGS.OPENWEATHER_API_KEY
+        self.units = _SETTINGS.OPENWEATHER_UNITS
+        self._base_params = {"appid": self.api_key, "units": self.units}
+        self.client = _shared_client
+
     def fetch(self, city: str) -> Optional[WeatherResponse]:
         """Fetch current weather data for a specified city.
 
@@ -66,22 +127,112 @@ class WeatherClient:
 
         Returns:
             A WeatherResponse object containing weather data, or None if the request fails.
+            Successful responses are cached per (city, units) for five minutes.
+        """
+        key = _cache_key(city, self.units)
+        cached = _cached_weather(key)
+        if cached is not None:
+            return cached
+        params = {"q": city, **self._base_params}
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                resp = self.client.get(self.base_url, params=params)
+                resp.raise_for_status()
+                weather = _to_weather_response(orjson.loads(resp.content))
+                if weather is not None:
+                    _store_weather(key, weather)
+                return weather
+            except _network_errors as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    logger.error("Weather API exception", detail=str(e), attempts=_MAX_ATTEMPTS)
+                    return None
+                time.sleep(_BACKOFF * 2 ** attempt)
+            except httpx.HTTPStatusError as e:
+                logger.error("Weather API error", status_code=e.response.status_code, detail=str(e))
+                return None
+            except Exception as e:
+                logger.error("Weather API exception", detail=str(e))
+                return None
+
+    def search_cities(self, city_query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """Search for cities matching a query using the geocoding API.
+
+        Args:
+            city_query: The city name or partial name to search for.
+            limit: Maximum number of results to return (default: 3).
+
+        Returns:
+            A list of dictionaries containing city information (name, country, lat, lon),
+            or an empty list if the request fails.
+        """
+        params = {"q": city_query, "limit": limit, "appid": self.api_key}
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                resp = self.client.get(GEO_URL, params=params)
+                resp.raise_for_status()
+                return orjson.loads(resp.content)
+            except _network_errors as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    logger.error("Geocoding API exception", detail=str(e), attempts=_MAX_ATTEMPTS)
+                    return []
+                time.sleep(_BACKOFF * 2 ** attempt)
+            except httpx.HTTPStatusError as e:
+                logger.error("Geocoding API error", status_code=e.response.status_code, detail=str(e))
+                return []
+            except Exception as e:
+                logger.error("Geocoding API exception", detail=str(e))
+                return []
+
+class AsyncWeatherClient:
+    """Async client for interacting with the OpenWeatherMap API.
+
+    Mirrors WeatherClient with coroutine methods, so independent requests can overlap,
+    e.g. ``await asyncio.gather(client.asearch_cities(q), client.afetch(city))``.
+    Each instance owns an HTTP/2 AsyncClient bound to the running event loop; close it
+    with aclose() or use the instance as an async context manager.
+    """
+    def __init__(self):
+        self.settings = _SETTINGS
+        self.base_url = WEATHER_URL
+        self.api_key = _SETTINGS.OPENWEATHER_API_KEY
+        self.units = _SETTINGS.OPENWEATHER_UNITS
+        self._base_params = {"appid": self.api_key, "units": self.units}
+        self.client = httpx.AsyncClient(timeout=5.0, http2=True, limits=_limits)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncWeatherClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def afetch(self, city: str) -> Optional[WeatherResponse]:
+        """Fetch current weather data for a specified city.
+
+        Args:
+            city: The name of the city to query weather for.
+
+        Returns:
+            A WeatherResponse object containing weather data, or None if the request fails.
+            Successful responses are cached per (city, units) for five minutes.
         """
-        params = {"q": city, "appid": self.api_key, "units": self.units}
+        key = _cache_key(city, self.units)
+        cached = _cached_weather(key)
+        if cached is not None:
+            return cached
+        params = {"q": city, **self._base_params}
         try:
-            resp = self.client.get(self.base_url, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            return WeatherResponse(
-                city=data["name"],
-                country=data["sys"]["country"],
-                temp=data["main"]["temp"],
-                feels_like=data["main"]["feels_like"],
-                description=data["weather"][0]["description"],
-                humidity=data["main"]["humidity"],
-                wind_speed=data["wind"]["speed"],
-                raw=data,
-            )
+            async for attempt in _ASYNC_RETRY.copy():
+                with attempt:
+                    resp = await self.client.get(self.base_url, params=params)
+                    resp.raise_for_status()
+            weather = _to_weather_response(orjson.loads(resp.content))
+            if weather is not None:
+                _store_weather(key, weather)
+            return weather
         except httpx.HTTPStatusError as e:
             logger.error("Weather API error", status_code=e.response.status_code, detail=str(e))
             return None
@@ -89,13 +240,7 @@ class WeatherClient:
             logger.error("Weather API exception", detail=str(e))
             return None
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5),
-        retry=retry_if_exception_type(_network_errors),
-        reraise=True
-    )
-    def search_cities(self, city_query: str, limit: int = 3) -> List[Dict[str, Any]]:
+    async def asearch_cities(self, city_query: str, limit: int = 3) -> List[Dict[str, Any]]:
         """Search for cities matching a query using the geocoding API.
 
         Args:
@@ -106,12 +251,13 @@ class WeatherClient:
             A list of dictionaries containing city information (name, country, lat, lon),
             or an empty list if the request fails.
         """
-        geo_url = "http://api.openweathermap.org/geo/1.0/direct"
         params = {"q": city_query, "limit": limit, "appid": self.api_key}
         try:
-            resp = self.client.get(geo_url, params=params)
-            resp.raise_for_status()
-            return resp.json()
+            async for attempt in _ASYNC_RETRY.copy():
+                with attempt:
+                    resp = await self.client.get(GEO_URL, params=params)
+                    resp.raise_for_status()
+            return orjson.loads(resp.content)
         except httpx.HTTPStatusError as e:
             logger.error("Geocoding API error", status_code=e.response.status_code, detail=str(e))
             return []
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from ai_rag_weather.rag.embed_cache import CachedEmbeddings
+
+class CountingEmbeddings:
+    model = "mock/model"
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_query(self, text):
+        self.calls.append([text])
+        return [float(len(text)), 0.5]
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+def test_embed_query_is_persisted(tmp_path):
+    inner = CountingEmbeddings()
+    first = CachedEmbeddings(inner, tmp_path).embed_query("hello")
+    second = CachedEmbeddings(inner, tmp_path).embed_query("hello")
+    assert first == second == [5.0, 0.5]
+    assert inner.calls == [["hello"]]
+    assert list((tmp_path / "mock_model").rglob("*.npy"))
+
+def test_embed_documents_only_embeds_misses(tmp_path):
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, tmp_path)
+    cached.embed_query("b")
+    vecs = cached.embed_documents(["aa", "b", "cccc"])
+    assert vecs == [[2.0, 0.5], [1.0, 0.5], [4.0, 0.5]]
+    assert inner.calls == [["b"], ["aa", "cccc"]]
+
+def test_failed_cache_write_still_returns_vector(tmp_path, monkeypatch):
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, tmp_path)
+    def fail(*args, **kwargs):
+        raise OSError("read-only file system")
+    monkeypatch.setattr(Path, "mkdir", fail)
+    assert cached.embed_query("hello") == [5.0, 0.5]
+    assert cached.embed_documents(["aa"]) == [[2.0, 0.5]]
+    assert not list(tmp_path.rglob("*.npy"))
@@ -43,7 +43,9 @@ def test_end_to_end(monkeypatch):
     graph = build_graph()
     monkeypatch.setattr(nodes, "WeatherClient", lambda *a, **kw: MockWeatherClient())
     monkeypatch.setattr(nodes, "RAGRetriever", lambda *a, **kw: MockRetriever())
-    monkeypatch.setattr(nodes, "LLMProvider", lambda *a, **kw: MockLLMProvider())
+    monkeypatch.setattr(nodes, "get_qdrant", lambda: object())
+    monkeypatch.setattr(nodes, "get_embeddings", lambda: object())
+    monkeypatch.setattr(nodes, "get_llm", lambda: MockLLMProvider().get())
     state = {
         "user_input": "What is weather condition in Hyderabad?",
         "intent": None,
@@ -1,5 +1,6 @@
 import pytest
-from ai_rag_weather.graph.nodes import _classify_intent, _extract_city
+from ai_rag_weather.graph import nodes
+from ai_rag_weather.graph.nodes import _city_candidates, _classify_intent, _extract_city
 
 @pytest.mark.parametrize("query, expected_intent", [
     ("What is the weather in Mumbai?", "weather"),
@@ -23,6 +24,8 @@ def test_classify_intent(query, expected_intent):
     ("What's the humidity in Tokyo?", "Tokyo"),
     ("Weather at Los Angeles California", "Los Angeles California"),
     ("No city mentioned", None),
+    ("Forecast for New York, USA", "New York"),
+    ("Summarize the Introduction section", None),
 ])
 def test_extract_city(query, expected_city):
     city = _extract_city(query)
@@ -30,3 +33,31 @@ def test_extract_city(query, expected_city):
         city = None
 
     assert city == expected_city
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("Forecast for Gurgaon", ["Gurgaon"]),
+    ("Sheffield forecast", ["Sheffield"]),
+    ("What is the Humidity Nice", []),
+    ("Will it be Sunny in Springfield Tomorrow", ["Springfield"]),
+])
+def test_city_candidates(query, expected):
+    assert _city_candidates(query) == expected
+
+
+def test_weather_node_geocodes_unknown_city(monkeypatch):
+    class MockWeatherClient:
+        def search_cities(self, city_query, limit=3):
+            return [{"name": "Gurugram", "country": "IN"}] if city_query == "Gurgaon" else []
+
+        def fetch(self, city):
+            self.fetched = city
+            return None
+
+    client = MockWeatherClient()
+    monkeypatch.setattr(nodes, "WeatherClient", lambda: client)
+    update = nodes.weather_node({"user_input": "Forecast for Gurgaon"})
+    assert client.fetched == "Gurugram"
+    assert "Please mention a city" not in update["answer"]
+
+    assert "Please mention a city" in nodes.weather_node({"user_input": "forecast please"})["answer"]
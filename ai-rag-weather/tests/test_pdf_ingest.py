@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("langchain.text_splitter")
+
+from langchain_core.documents import Document
+
+from ai_rag_weather.ingestion import pdf_ingest
+from ai_rag_weather.vectordb.qdrant_store import COLLECTION_NAME, QdrantStore
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+def test_ingest_pdf_ids_are_contiguous_across_batches(monkeypatch):
+    batches = [
+        [Document(page_content=f"first {i}", metadata={"source": "doc.pdf", "page": 0}) for i in range(3)],
+        [Document(page_content=f"second {i}", metadata={"source": "doc.pdf", "page": 1}) for i in range(2)],
+        [Document(page_content=f"third {i}", metadata={"source": "doc.pdf", "page": 2}) for i in range(4)],
+    ]
+    monkeypatch.setattr(pdf_ingest, "iter_pdf_chunks", lambda pdf_path: iter(batches))
+    monkeypatch.setattr(pdf_ingest, "UPLOAD_BATCH_SIZE", 2)
+    store = QdrantStore(":memory:")
+    store.ensure_collection(2)
+    embeddings = FakeEmbeddings()
+
+    count = pdf_ingest.ingest_pdf("doc.pdf", embeddings, store)
+
+    assert count == 9
+    assert [len(call) for call in embeddings.calls] == [3, 2, 4]
+    points, _ = store.client.scroll(COLLECTION_NAME, limit=100, with_payload=True)
+    by_id = {p.id: p.payload for p in points}
+    assert sorted(by_id) == list(range(9))
+    assert all(payload["chunk"] == pid for pid, payload in by_id.items())
+    expected = [d.page_content for batch in batches for d in batch]
+    assert [by_id[i]["text"] for i in range(9)] == expected
@@ -0,0 +1,167 @@
+import asyncio
+import numpy as np
+import pytest
+from qdrant_client import models
+from ai_rag_weather.vectordb.qdrant_store import (
+    COLLECTION_NAME,
+    DEFAULT_INDEXING_THRESHOLD,
+    QdrantStore,
+    _INT8_QUANTIZATION,
+)
+
+def test_async_client_per_event_loop():
+    store = QdrantStore(":memory:")
+
+    async def get_client():
+        client = store.aclient
+        assert store.aclient is client
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+
+    async def closed():
+        async with store:
+            store.aclient
+        return store._aclient
+
+    assert asyncio.run(closed()) is None
+
+def _track_indexing_threshold(store, monkeypatch, initial):
+    # Local mode ignores optimizer settings, so record them on the side.
+    state = {"threshold": initial}
+    get_collection = store.client.get_collection
+
+    def fake_get_collection(name):
+        info = get_collection(name)
+        info.config.optimizer_config.indexing_threshold = state["threshold"]
+        return info
+
+    def fake_update_collection(name, optimizers_config=None, **kwargs):
+        state["threshold"] = optimizers_config.indexing_threshold
+
+    monkeypatch.setattr(store.client, "get_collection", fake_get_collection)
+    monkeypatch.setattr(store.client, "update_collection", fake_update_collection)
+    return state
+
+def test_bulk_load_restores_previous_indexing_threshold(monkeypatch):
+    store = QdrantStore(":memory:")
+    store.ensure_collection(4)
+    state = _track_indexing_threshold(store, monkeypatch, initial=5000)
+
+    store.ensure_collection(4, bulk=True)
+    assert state["threshold"] == 0
+    store.finalize_bulk()
+    assert state["threshold"] == 5000
+
+def test_bulk_load_of_new_collection_restores_default_threshold(monkeypatch):
+    store = QdrantStore(":memory:")
+    state = _track_indexing_threshold(store, monkeypatch, initial=None)
+
+    store.ensure_collection(4, bulk=True)
+    store.finalize_bulk()
+    assert state["threshold"] == DEFAULT_INDEXING_THRESHOLD
+
+def test_bulk_upload():
+    store = QdrantStore(":memory:")
+    store.ensure_collection(4)
+    vectors = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]
+    payloads = [{"text": "alpha"}, {"text": "beta"}, {"text": "gamma"}]
+    store.bulk_upload(vectors, payloads, ids=[10, 11, 12], parallel=1, batch_size=2)
+
+    points, _ = store.client.scroll(COLLECTION_NAME, limit=10, with_payload=True, with_vectors=True)
+    assert {p.id: p.payload for p in points} == {10: {"text": "alpha"}, 11: {"text": "beta"}, 12: {"text": "gamma"}}
+    assert [p.vector for p in sorted(points, key=lambda p: p.id)] == vectors
+
+def _store_with_points():
+    store = QdrantStore(":memory:")
+    store.ensure_collection(4)
+    store.upsert_batch(
+        [1, 2, 3],
+        [[1.0, 0.0, 0.0, 0.0], [0.9, 0.1, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        [
+            {"text": "alpha", "page": 1, "source": "a.pdf"},
+            {"text": "beta", "page": 2, "source": "a.pdf"},
+            {"text": "gamma", "page": 3, "source": "b.pdf"},
+        ],
+    )
+    return store
+
+def test_ensure_collection_caches_and_invalidates_size(monkeypatch):
+    store = QdrantStore(":memory:")
+    store.ensure_collection(4)
+    assert store._cached_size == 4
+
+    calls = []
+    get_collection = store.client.get_collection
+    monkeypatch.setattr(store.client, "get_collection", lambda name: calls.append(name) or get_collection(name))
+    store.ensure_collection(4)
+    assert calls == []
+
+    store.ensure_collection(8)
+    assert store._cached_size == 8
+    assert store._extract_vector_size(get_collection(COLLECTION_NAME).config.params.vectors) == 8
+
+    with pytest.raises(RuntimeError):
+        store.ensure_collection(4, recreate_if_mismatch=False)
+
+def test_ensure_collection_reads_existing_size():
+    store = _store_with_points()
+    fresh = QdrantStore(":memory:")
+    fresh.client = store.client
+    assert fresh._get_size_if_exists() == 4
+
+def test_ensure_collection_quantization_flag(monkeypatch):
+    store = QdrantStore(":memory:")
+    created = []
+    create_collection = store.client.create_collection
+
+    def spy(**kwargs):
+        created.append(kwargs)
+        return create_collection(**kwargs)
+
+    monkeypatch.setattr(store.client, "create_collection", spy)
+    store.ensure_collection(4)
+    assert created[-1]["quantization_config"] == _INT8_QUANTIZATION
+    assert created[-1]["optimizers_config"] is None
+
+    store.ensure_collection(8, quantize=False, bulk=True)
+    assert created[-1]["quantization_config"] is None
+    assert created[-1]["optimizers_config"].indexing_threshold == 0
+
+def test_search_projects_payload():
+    store = _store_with_points()
+    (hit,) = store.search([1.0, 0.0, 0.0, 0.0], top_k=1)
+    assert hit["id"] == 1
+    assert hit["text"] == "alpha"
+    assert hit["payload"] == {"text": "alpha", "page": 1}
+
+    (hit,) = store.search([1.0, 0.0, 0.0, 0.0], top_k=1, payload_fields=["source"])
+    assert hit["payload"] == {"source": "a.pdf"}
+    assert hit["text"] is None
+
+def test_search_with_filter():
+    store = _store_with_points()
+    query_filter = models.Filter(
+        must=[models.FieldCondition(key="source", match=models.MatchValue(value="b.pdf"))]
+    )
+    hits = store.search([1.0, 0.0, 0.0, 0.0], top_k=3, query_filter=query_filter)
+    assert [h["id"] for h in hits] == [3]
+
+def test_search_batch():
+    store = _store_with_points()
+    results = store.search_batch([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]], top_k=1)
+    assert [[h["id"] for h in hits] for hits in results] == [[1], [3]]
+
+    query_filter = models.Filter(
+        must=[models.FieldCondition(key="page", match=models.MatchValue(value=2))]
+    )
+    results = store.search_batch([[1.0, 0.0, 0.0, 0.0]], top_k=3, query_filter=query_filter)
+    assert [[h["id"] for h in hits] for hits in results] == [[2]]
+
+def test_search_accepts_numpy_vectors():
+    store = _store_with_points()
+    queries = np.eye(4, dtype=np.float32)[:2]
+    assert [h["id"] for h in store.search(queries[0], top_k=1)] == [1]
+    assert [[h["id"] for h in hits] for hits in store.search_batch(queries, top_k=1)] == [[1], [3]]
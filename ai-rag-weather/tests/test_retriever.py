@@ -1,15 +1,29 @@
+import asyncio
+import numpy as np
 from ai_rag_weather.rag.retriever import RAGRetriever
+from ai_rag_weather.rag.similarity_cache import SimilarityCache
 
 class MockVectorDB:
-    def search(self, query_vector, top_k=5, score_threshold=0.0):
+    def search(self, query_vector, top_k=5, score_threshold=0.0, query_filter=None):
+        self.last_vector = query_vector
+        self.last_filter = query_filter
         return [
             {"payload": {"page": 1, "text": "Relevant chunk 1"}},
             {"payload": {"page": 2, "text": "Relevant chunk 2"}},
         ]
 
+    async def asearch(self, query_vector, top_k=5, score_threshold=0.0, query_filter=None):
+        return self.search(query_vector, top_k=top_k, score_threshold=score_threshold, query_filter=query_filter)
+
+    def search_batch(self, query_vectors, top_k=5, score_threshold=0.0):
+        return [self.search(v, top_k=top_k, score_threshold=score_threshold) for v in query_vectors]
+
 class MockEmbeddings:
     def embed_query(self, text):
-        return [0.1] * 384
+        return np.full(384, 0.1, dtype=np.float32)
+
+    def embed_documents(self, texts):
+        return [[0.1] * 384 for _ in texts]
 
 class MockLLM:
     def __call__(self, prompt):
@@ -23,9 +37,70 @@ def test_retrieve():
     )
 
     result = retriever.retrieve("test query")
+    assert retriever.vectordb.last_vector.dtype == np.float32
     assert "contexts" in result
     assert "query" in result
     assert len(result["contexts"]) == 2
     assert result["contexts"][0]["text"] == "Relevant chunk 1"
     assert result["contexts"][1]["text"] == "Relevant chunk 2"
     assert "draft" not in result
+
+def test_aretrieve():
+    retriever = RAGRetriever(
+        vectordb=MockVectorDB(),
+        embeddings=MockEmbeddings(),
+        llm=MockLLM()
+    )
+
+    result = asyncio.run(retriever.aretrieve("test query"))
+    assert result["query"] == "test query"
+    assert [c["text"] for c in result["contexts"]] == ["Relevant chunk 1", "Relevant chunk 2"]
+
+def test_retrieve_many():
+    retriever = RAGRetriever(
+        vectordb=MockVectorDB(),
+        embeddings=MockEmbeddings(),
+        llm=MockLLM()
+    )
+
+    results = retriever.retrieve_many(["first query", "second query"])
+    assert [r["query"] for r in results] == ["first query", "second query"]
+    assert all(len(r["contexts"]) == 2 for r in results)
+    assert retriever.retrieve_many([]) == []
+
+def test_retrieve_uses_similarity_cache():
+    class CountingVectorDB(MockVectorDB):
+        calls = 0
+
+        def search(self, query_vector, top_k=5, score_threshold=0.0, query_filter=None):
+            CountingVectorDB.calls += 1
+            return super().search(query_vector, top_k=top_k, score_threshold=score_threshold)
+
+    retriever = RAGRetriever(
+        vectordb=CountingVectorDB(),
+        embeddings=MockEmbeddings(),
+        llm=MockLLM(),
+        sim_cache=SimilarityCache(),
+    )
+
+    first = retriever.retrieve("test query")
+    second = retriever.retrieve("test query again")
+    assert second["contexts"] == first["contexts"]
+    assert second["query"] == "test query again"
+    assert CountingVectorDB.calls == 1
+
+def test_retrieve_with_filters():
+    vectordb = MockVectorDB()
+    retriever = RAGRetriever(
+        vectordb=vectordb,
+        embeddings=MockEmbeddings(),
+        llm=MockLLM()
+    )
+
+    retriever.retrieve("test query")
+    assert vectordb.last_filter is None
+
+    retriever.retrieve("test query", filters={"page": 2})
+    (condition,) = vectordb.last_filter.must
+    assert condition.key == "page"
+    assert condition.match.value == 2
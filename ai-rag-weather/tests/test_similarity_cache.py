@@ -0,0 +1,37 @@
+from ai_rag_weather.rag.similarity_cache import SimilarityCache
+
+def test_lookup_matches_near_duplicates_only():
+    cache = SimilarityCache(threshold=0.97)
+    cache.insert([1.0, 0.0, 0.0], "a")
+    cache.insert([0.0, 1.0, 0.0], "b")
+
+    assert cache.lookup([0.99, 0.05, 0.0]) == "a"
+    assert cache.lookup([0.7, 0.7, 0.0]) is None
+    assert cache.lookup([1.0, 0.0, 0.0], scope="other") is None
+
+def test_evicts_least_recently_used():
+    cache = SimilarityCache(maxsize=2)
+    cache.insert([1.0, 0.0, 0.0], "a")
+    cache.insert([0.0, 1.0, 0.0], "b")
+    assert cache.lookup([1.0, 0.0, 0.0]) == "a"
+
+    cache.insert([0.0, 0.0, 1.0], "c")
+    assert len(cache) == 2
+    assert cache.lookup([0.0, 1.0, 0.0]) is None
+    assert cache.lookup([1.0, 0.0, 0.0]) == "a"
+    assert cache.lookup([0.0, 0.0, 1.0]) == "c"
+
+    cache.clear()
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
+
+def test_entries_expire_after_ttl(monkeypatch):
+    from ai_rag_weather.rag import similarity_cache
+    now = [1000.0]
+    monkeypatch.setattr(similarity_cache.time, "monotonic", lambda: now[0])
+
+    cache = SimilarityCache(ttl=60)
+    cache.insert([1.0, 0.0, 0.0], "a")
+    now[0] += 59
+    assert cache.lookup([1.0, 0.0, 0.0]) == "a"
+    now[0] += 2
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
@@ -1,5 +1,9 @@
+import asyncio
+import json
+import httpx
 import pytest
-from ai_rag_weather.weather.client import WeatherClient, WeatherResponse
+from ai_rag_weather.weather import client as weather_client
+from ai_rag_weather.weather.client import AsyncWeatherClient, WeatherClient, WeatherResponse
 
 class MockResponse:
     def __init__(self, status_code=200, json_data=None):
@@ -13,9 +17,17 @@ class MockResponse:
     def json(self):
         return self._json
 
+    @property
+    def content(self):
+        return json.dumps(self._json).encode()
+
 @pytest.fixture
 def mock_httpx_get(monkeypatch):
+    weather_client._weather_cache.clear()
+    calls = []
+
     def fake_get(client, url, params=None, timeout=None):
+        calls.append(params)
         print(f"Mocked httpx.Client.get called with url={url}, params={params}")
         if params and params.get("q") == "fail":
             raise Exception("HTTP error")
@@ -28,6 +40,11 @@ def mock_httpx_get(monkeypatch):
         })
     monkeypatch.setattr("httpx.Client.get", fake_get)
 
+    async def fake_aget(client, url, params=None, timeout=None):
+        return fake_get(client, url, params=params, timeout=timeout)
+    monkeypatch.setattr("httpx.AsyncClient.get", fake_aget)
+    return calls
+
 def test_weather_success(mock_httpx_get):
     client = WeatherClient()
     resp = client.fetch("London")
@@ -43,4 +60,66 @@ def test_weather_success(mock_httpx_get):
 def test_weather_fail(mock_httpx_get):
     client = WeatherClient()
     resp = client.fetch("fail")
-    assert resp is None
\ No newline at end of file
+    assert resp is None
+
+def test_async_weather_success(mock_httpx_get):
+    async def run():
+        async with AsyncWeatherClient() as client:
+            return await asyncio.gather(client.afetch("London"), client.afetch("fail"))
+
+    ok, failed = asyncio.run(run())
+    assert isinstance(ok, WeatherResponse)
+    assert ok.city == "London"
+    assert ok.humidity == 80
+    assert failed is None
+
+def test_weather_fetch_is_cached(mock_httpx_get):
+    client = WeatherClient()
+    first = client.fetch("London")
+    second = client.fetch("  london ")
+    assert second is first
+    assert len(mock_httpx_get) == 1
+    assert client.fetch("fail") is None
+    assert client.fetch("fail") is None
+    assert len(mock_httpx_get) == 3
+
+def test_weather_retries_network_errors(monkeypatch):
+    weather_client._weather_cache.clear()
+    attempts, sleeps = [], []
+
+    def flaky_get(client, url, params=None, timeout=None):
+        attempts.append(params)
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setattr("httpx.Client.get", flaky_get)
+    monkeypatch.setattr(weather_client.time, "sleep", sleeps.append)
+    assert WeatherClient().fetch("London") is None
+    assert len(attempts) == 3
+    assert sleeps == [0.5, 1.0]
+
+def test_weather_malformed_payload(monkeypatch):
+    weather_client._weather_cache.clear()
+    monkeypatch.setattr("httpx.Client.get", lambda client, url, params=None, timeout=None: MockResponse(200, {"name": "London"}))
+    assert WeatherClient().fetch("London") is None
+    assert len(weather_client._weather_cache) == 0
+
+def test_async_weather_retries_network_errors(monkeypatch):
+    from tenacity import wait_none
+    weather_client._weather_cache.clear()
+    attempts = []
+
+    async def flaky_aget(client, url, params=None, timeout=None):
+        attempts.append(params)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("connection refused")
+        return MockResponse(200, [{"name": "London", "country": "GB"}])
+
+    monkeypatch.setattr("httpx.AsyncClient.get", flaky_aget)
+    monkeypatch.setattr(weather_client, "_ASYNC_RETRY", weather_client._ASYNC_RETRY.copy(wait=wait_none()))
+
+    async def run():
+        async with AsyncWeatherClient() as client:
+            return await client.asearch_cities("London")
+
+    assert asyncio.run(run()) == [{"name": "London", "country": "GB"}]
+    assert len(attempts) == 3